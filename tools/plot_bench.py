@@ -3,99 +3,240 @@
 Benchmark visualization for temporal-slab
 
 Generates 4 key charts from CSV benchmark output:
-1. Latency CDF - Distribution of allocation latency (shows tail behavior)
+1. Latency CDF - Distribution of allocation latency (empirical when raw samples are available)
 2. Fragmentation - Internal fragmentation by size class
 3. RSS over time - Memory stability under churn (when churn_test CSV available)
 4. P99 vs threads - Tail latency scaling (when multi-thread data available)
 
 Usage:
-    python3 plot_bench.py [--input benchmarks/results] [--output docs/images]
+    python3 plot_bench.py [--input benchmarks/results] [--output docs/images] [--no-cache] [--jobs N] [--dpi N] [--watch]
+
+Parsed CSVs are cached next to the source file as <name>.csv.pkl and reused
+while the CSV's mtime and size are unchanged.
+
+With --watch the script stays running, polls the input directory, and
+re-renders only the charts whose input data changed.
 """
 
 import argparse
 import csv
+import hashlib
+import os
+import pickle
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 try:
     import matplotlib
     matplotlib.use('Agg')  # Non-interactive backend
     import matplotlib.pyplot as plt
     import numpy as np
+    from numpy.lib import recfunctions as rfn
 except ImportError:
     print("Error: matplotlib not installed", file=sys.stderr)
     print("Install with: pip install matplotlib numpy", file=sys.stderr)
     sys.exit(1)
 
 
-def load_csv(path: Path) -> List[Dict]:
-    """Load CSV file into list of dictionaries (handles multiple sections with headers)"""
+# Charts use fixed fig.subplots_adjust() margins (chosen to match what
+# tight_layout produced for typical benchmark output) instead of tight_layout,
+# which needs an extra Agg render pass just to measure text extents.
+
+# PNG resolution; 100 dpi is plenty for docs pages (pass --dpi 150 for print)
+DEFAULT_DPI = 100
+
+# Seconds between polls of the input directory in --watch mode
+WATCH_INTERVAL = 0.5
+
+# Bump whenever load_csv's return format changes so stale caches are ignored
+CACHE_VERSION = 4
+
+# Latency percentile columns and their chart labels (same order as Percentiles)
+LATENCY_METRICS = ('p50_ns', 'p95_ns', 'p99_ns', 'p999_ns')
+LATENCY_LABELS = ('p50', 'p95', 'p99', 'p999')
+
+# Columns each chart actually reads, per CSV schema. A section is routed to the
+# first schema whose columns all appear in its header (latency is checked first
+# since only it has 'op'); all other columns are never parsed.
+SCHEMAS: Dict[str, Tuple[str, ...]] = {
+    'latency': ('op',) + LATENCY_METRICS,
+    'raw_latency': ('op', 'raw_latency_ns'),
+    'fragmentation': ('size_class', 'wasted', 'efficiency_pct'),
+    'rss': ('cycle', 'rss_mib', 'slabs_allocated', 'slabs_recycled'),
+    'scaling': ('threads', 'throughput_ops_sec', 'p99_ns'),
+}
+
+# Column types for parsing; columns not listed are float64
+COLUMN_DTYPES: Dict[str, object] = {
+    'op': 'U8',
+    'size_class': np.int64,
+    'wasted': np.int64,
+    'cycle': np.int64,
+    'slabs_allocated': np.int64,
+    'slabs_recycled': np.int64,
+    'threads': np.int64,
+}
+
+
+def classify_section(header: List[str]) -> Optional[str]:
+    """Identify which benchmark schema a section's header belongs to"""
+    columns = set(header)
+    for schema, needed in SCHEMAS.items():
+        if columns.issuperset(needed):
+            return schema
+    return None
+
+
+def _columns_to_array(columns: Tuple[str, ...], rows: List[Tuple[str, ...]]) -> np.ndarray:
+    """Convert narrow string row tuples into a structured array, one typed column at a time"""
+    data = np.empty(len(rows), dtype=[(name, COLUMN_DTYPES.get(name, np.float64))
+                                      for name in columns])
+    for name, values in zip(columns, zip(*rows)):
+        data[name] = np.array(values).astype(data.dtype[name])
+    return data
+
+
+def load_csv(path: Path) -> List[Tuple[str, np.ndarray]]:
+    """Load CSV file into (schema, structured array) pairs, one per section
+    
+    Sections are separated by blank lines and each starts with its own header.
+    The file is streamed through csv.reader: each header is classified once,
+    and only the schema's columns are kept from each row (rows of sections
+    with an unknown header are skipped).
+    """
     if not path.exists():
         return []
     
     results = []
-    with open(path, 'r') as f:
-        lines = f.readlines()
-    
-    current_section = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            # Blank line - process accumulated section
-            if current_section:
-                reader = csv.DictReader(current_section)
-                results.extend(list(reader))
-                current_section = []
-        else:
-            current_section.append(line)
+    schema = None      # Schema of the current section (None = skip its rows)
+    indices = ()       # Positions of the schema's columns in the current header
+    rows = []
+    in_section = False
+    
+    def finish_section():
+        if schema is not None and rows:
+            results.append((schema, _columns_to_array(SCHEMAS[schema], rows)))
+    
+    with open(path, 'r', newline='') as f:
+        for row in csv.reader(f):
+            if not any(cell.strip() for cell in row):
+                # Blank line - close the accumulated section
+                finish_section()
+                schema, rows, in_section = None, [], False
+            elif not in_section:
+                header = [cell.strip() for cell in row]
+                schema = classify_section(header)
+                if schema is not None:
+                    indices = tuple(header.index(name) for name in SCHEMAS[schema])
+                in_section = True
+            elif schema is not None:
+                rows.append(tuple(row[i] for i in indices))
     
     # Process final section
-    if current_section:
-        reader = csv.DictReader(current_section)
-        results.extend(list(reader))
+    finish_section()
     
     return results
 
 
-def plot_fragmentation(data: List[Dict], output_dir: Path):
+def load_csv_cached(path: Path) -> List[Tuple[str, np.ndarray]]:
+    """Load CSV via load_csv, memoized in a pickle sidecar keyed by (mtime, size)"""
+    stat = path.stat()
+    key = (CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+    cache_file = path.with_suffix(path.suffix + '.pkl')
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, sections = pickle.load(f)
+        if cached_key == key:
+            return sections
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass  # Missing or unreadable cache - reparse
+    
+    sections = load_csv(path)
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump((key, sections), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"Warning: could not write cache {cache_file}: {e}", file=sys.stderr)
+    return sections
+
+
+class Percentiles(NamedTuple):
+    """Latency percentiles (ns) for one operation, from a latency CSV row"""
+    p50: float
+    p95: float
+    p99: float
+    p999: float
+
+
+def op_percentiles(latency_data: np.ndarray, op: str) -> Optional[Percentiles]:
+    """Percentiles from the first latency row for op ('alloc' or 'free'), if any"""
+    if not latency_data.size:
+        return None
+    idx = np.flatnonzero(latency_data['op'] == op)
+    if not idx.size:
+        return None
+    row = latency_data[idx[0]]
+    return Percentiles(*(float(row[m]) for m in LATENCY_METRICS))
+
+
+def merge_sections(sections: List[np.ndarray]) -> np.ndarray:
+    """Concatenate same-schema sections (possibly from different files) into one array"""
+    if not sections:
+        return np.empty(0)
+    return rfn.stack_arrays(sections, usemask=False, autoconvert=True)
+
+
+# Reused across charts so each plot skips Figure/canvas construction. Module
+# state is per-process, so every run_plots worker gets its own Figure.
+_FIGURE = None
+
+
+def _figure(figsize: Tuple[float, float]):
+    """Return this process's shared Figure, cleared and resized for a new chart"""
+    global _FIGURE
+    if _FIGURE is None:
+        _FIGURE = plt.figure(figsize=figsize)
+    else:
+        _FIGURE.clear()
+        _FIGURE.set_size_inches(figsize)
+    return _FIGURE
+
+
+def plot_fragmentation(data: np.ndarray, output_dir: Path, dpi: int = DEFAULT_DPI):
     """Plot internal fragmentation by size class"""
-    if not data:
+    if not data.size:
         print("No fragmentation data found", file=sys.stderr)
         return
     
-    # Group by size class
-    size_classes = {}
-    for row in data:
-        if 'size_class' not in row:
-            continue
-        sc = int(row['size_class'])
-        if sc not in size_classes:
-            size_classes[sc] = {'requested': [], 'wasted': [], 'efficiency': []}
-        size_classes[sc]['requested'].append(int(row['requested']))
-        size_classes[sc]['wasted'].append(int(row['wasted']))
-        size_classes[sc]['efficiency'].append(float(row['efficiency_pct']))
+    # Group by size class: per-class means in one bincount pass per column
+    classes, inv = np.unique(data['size_class'], return_inverse=True)
+    counts = np.bincount(inv)
+    avg_waste = np.bincount(inv, weights=data['wasted']) / counts
+    avg_efficiency = np.bincount(inv, weights=data['efficiency_pct']) / counts
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    fig = _figure((14, 5))
+    ax1, ax2 = fig.subplots(1, 2)
+    
+    # Shared x positions and size-class labels for both plots
+    x = np.arange(len(classes))
+    labels = [f"{c}B" for c in classes]
+    for ax in (ax1, ax2):
+        ax.set_xticks(x)
+        ax.set_xticklabels(labels)
+        ax.set_xlabel('Size Class', fontsize=11)
     
     # Left plot: Average waste per size class
-    classes = sorted(size_classes.keys())
-    avg_waste = [np.mean(size_classes[sc]['wasted']) for sc in classes]
-    avg_efficiency = [np.mean(size_classes[sc]['efficiency']) for sc in classes]
-    
-    ax1.bar(range(len(classes)), avg_waste, color='steelblue', alpha=0.7)
-    ax1.set_xticks(range(len(classes)))
-    ax1.set_xticklabels([f"{c}B" for c in classes])
-    ax1.set_xlabel('Size Class', fontsize=11)
+    ax1.bar(x, avg_waste, color='steelblue', alpha=0.7)
     ax1.set_ylabel('Average Wasted Bytes', fontsize=11)
     ax1.set_title('Internal Fragmentation by Size Class', fontsize=12, fontweight='bold')
     ax1.grid(axis='y', alpha=0.3)
     
     # Right plot: Efficiency distribution
-    ax2.bar(range(len(classes)), avg_efficiency, color='forestgreen', alpha=0.7)
-    ax2.set_xticks(range(len(classes)))
-    ax2.set_xticklabels([f"{c}B" for c in classes])
-    ax2.set_xlabel('Size Class', fontsize=11)
+    ax2.bar(x, avg_efficiency, color='forestgreen', alpha=0.7)
     ax2.set_ylabel('Space Efficiency (%)', fontsize=11)
     ax2.set_title('Allocation Efficiency by Size Class', fontsize=12, fontweight='bold')
     ax2.axhline(y=88.9, color='red', linestyle='--', linewidth=1, label='Overall Avg (88.9%)')
@@ -103,34 +244,27 @@ def plot_fragmentation(data: List[Dict], output_dir: Path):
     ax2.set_ylim([70, 105])
     ax2.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
+    fig.subplots_adjust(left=0.05, right=0.99, top=0.92, bottom=0.12, wspace=0.15)
     output_path = output_dir / 'fragmentation.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    print(f"Generated: {output_path}")
-    plt.close()
+    fig.savefig(output_path, dpi=dpi)
+    print(f"Generated: {output_path}", flush=True)
 
 
-def plot_latency_comparison(data: List[Dict], output_dir: Path):
+def plot_latency_comparison(alloc: Optional[Percentiles], free: Optional[Percentiles],
+                            output_dir: Path, dpi: int = DEFAULT_DPI):
     """Plot latency comparison (alloc vs free)"""
-    if not data:
-        print("No latency data found", file=sys.stderr)
-        return
-    
-    alloc_data = [row for row in data if row.get('op') == 'alloc']
-    free_data = [row for row in data if row.get('op') == 'free']
-    
-    if not alloc_data:
+    if alloc is None:
         print("No allocation latency data", file=sys.stderr)
         return
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = _figure((10, 6))
+    ax = fig.subplots()
     
-    metrics = ['p50_ns', 'p95_ns', 'p99_ns', 'p999_ns']
-    x = np.arange(len(metrics))
+    x = np.arange(len(LATENCY_LABELS))
     width = 0.35
     
-    alloc_vals = [float(alloc_data[0].get(m, 0)) for m in metrics]
-    free_vals = [float(free_data[0].get(m, 0)) if free_data else 0 for m in metrics]
+    alloc_vals = list(alloc)
+    free_vals = list(free) if free is not None else [0] * len(alloc)
     
     ax.bar(x - width/2, alloc_vals, width, label='Allocation', color='steelblue', alpha=0.8)
     ax.bar(x + width/2, free_vals, width, label='Free', color='coral', alpha=0.8)
@@ -139,47 +273,68 @@ def plot_latency_comparison(data: List[Dict], output_dir: Path):
     ax.set_ylabel('Latency (nanoseconds)', fontsize=11)
     ax.set_title('Allocation vs Free Latency Distribution', fontsize=12, fontweight='bold')
     ax.set_xticks(x)
-    ax.set_xticklabels(['p50', 'p95', 'p99', 'p999'])
+    ax.set_xticklabels(LATENCY_LABELS)
     ax.legend(loc='upper left')
     ax.grid(axis='y', alpha=0.3)
     
     # Add horizontal line at 100ns (HFT threshold)
     ax.axhline(y=100, color='red', linestyle='--', linewidth=1, alpha=0.5, label='100ns threshold')
     
-    plt.tight_layout()
+    fig.subplots_adjust(left=0.09, right=0.98, top=0.93, bottom=0.1)
     output_path = output_dir / 'latency_percentiles.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    print(f"Generated: {output_path}")
-    plt.close()
+    fig.savefig(output_path, dpi=dpi)
+    print(f"Generated: {output_path}", flush=True)
 
 
-def plot_latency_cdf(data: List[Dict], output_dir: Path):
-    """Plot cumulative distribution of allocation latency"""
-    # This requires raw latency data, not percentiles
-    # For now, show a conceptual chart using percentiles as proxy
-    
-    alloc_data = [row for row in data if row.get('op') == 'alloc']
-    if not alloc_data:
-        return
+def ecdf(samples: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Empirical CDF: sorted samples and their cumulative probabilities in (0, 1]"""
+    x = np.sort(samples)
+    return x, np.arange(1, x.size + 1, dtype=np.float64) / x.size
+
+
+def _thin_cdf(x: np.ndarray, y: np.ndarray, max_points: int = 10000) -> Tuple[np.ndarray, np.ndarray]:
+    """Downsample a sorted CDF for plotting, keeping every point of the slowest tail"""
+    if x.size <= max_points:
+        return x, y
+    half = max_points // 2
+    idx = np.unique(np.concatenate([np.linspace(0, x.size - 1, half).astype(np.int64),
+                                    np.arange(x.size - half, x.size)]))
+    return x[idx], y[idx]
+
+
+def plot_latency_cdf(alloc: Optional[Percentiles], output_dir: Path, dpi: int = DEFAULT_DPI,
+                     raw_data: Optional[np.ndarray] = None):
+    """Plot cumulative distribution of allocation latency
     
-    row = alloc_data[0]
+    Uses the empirical CDF of raw samples (raw_latency_ns sections) when
+    available, otherwise approximates the curve from the p50..p999 summary.
+    """
     percentiles = [0.5, 0.95, 0.99, 0.999]
-    latencies = [
-        float(row.get('p50_ns', 0)),
-        float(row.get('p95_ns', 0)),
-        float(row.get('p99_ns', 0)),
-        float(row.get('p999_ns', 0))
-    ]
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    ax.plot([l for l in latencies], [p * 100 for p in percentiles], 
-            marker='o', linewidth=2, markersize=8, color='steelblue')
+    samples = np.empty(0)
+    if raw_data is not None and raw_data.size:
+        samples = raw_data['raw_latency_ns'][raw_data['op'] == 'alloc']
+    
+    fig = _figure((10, 6))
+    ax = fig.subplots()
+    
+    if samples.size:
+        x, y = ecdf(samples)
+        latencies = [float(v) for v in np.quantile(x, percentiles)]
+        x, y = _thin_cdf(x, y)
+        ax.plot(x, y * 100, linewidth=2, color='steelblue', drawstyle='steps-post')
+        title = f'Allocation Latency CDF ({samples.size:,} samples)'
+    else:
+        if alloc is None:
+            return
+        
+        latencies = list(alloc)
+        ax.plot([l for l in latencies], [p * 100 for p in percentiles], 
+                marker='o', linewidth=2, markersize=8, color='steelblue')
+        title = 'Allocation Latency CDF (Approximation from Percentiles)'
     
     ax.set_xlabel('Latency (nanoseconds)', fontsize=11)
     ax.set_ylabel('Cumulative Probability (%)', fontsize=11)
-    ax.set_title('Allocation Latency CDF (Approximation from Percentiles)', 
-                 fontsize=12, fontweight='bold')
+    ax.set_title(title, fontsize=12, fontweight='bold')
     ax.grid(True, alpha=0.3)
     ax.set_xscale('log')
     
@@ -192,25 +347,25 @@ def plot_latency_cdf(data: List[Dict], output_dir: Path):
                     fontsize=9,
                     bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.3))
     
-    plt.tight_layout()
+    fig.subplots_adjust(left=0.08, right=0.92, top=0.93, bottom=0.1)
     output_path = output_dir / 'latency_cdf.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    print(f"Generated: {output_path}")
-    plt.close()
+    fig.savefig(output_path, dpi=dpi)
+    print(f"Generated: {output_path}", flush=True)
 
 
-def plot_rss_over_time(data: List[Dict], output_dir: Path):
+def plot_rss_over_time(data: np.ndarray, output_dir: Path, dpi: int = DEFAULT_DPI):
     """Plot RSS stability over churn cycles"""
-    if not data:
+    if not data.size:
         print("No RSS churn data found", file=sys.stderr)
         return
     
-    cycles = [int(row['cycle']) for row in data]
-    rss_values = [float(row['rss_mib']) for row in data]
-    allocated = [int(row['slabs_allocated']) for row in data]
-    recycled = [int(row['slabs_recycled']) for row in data]
+    cycles = data['cycle']
+    rss_values = data['rss_mib']
+    allocated = data['slabs_allocated']
+    recycled = data['slabs_recycled']
     
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
+    fig = _figure((12, 8))
+    ax1, ax2 = fig.subplots(2, 1)
     
     # Top plot: RSS over time
     ax1.plot(cycles, rss_values, linewidth=2, color='steelblue', marker='o', markersize=3)
@@ -220,7 +375,7 @@ def plot_rss_over_time(data: List[Dict], output_dir: Path):
     ax1.grid(True, alpha=0.3)
     
     # Add growth annotation
-    if rss_values:
+    if rss_values.size:
         rss_initial = rss_values[0]
         rss_final = rss_values[-1]
         growth_pct = ((rss_final - rss_initial) / rss_initial) * 100
@@ -237,24 +392,24 @@ def plot_rss_over_time(data: List[Dict], output_dir: Path):
     ax2.legend(loc='upper left')
     ax2.grid(True, alpha=0.3)
     
-    plt.tight_layout()
+    fig.subplots_adjust(left=0.08, right=0.98, top=0.95, bottom=0.07, hspace=0.3)
     output_path = output_dir / 'rss_over_time.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    print(f"Generated: {output_path}")
-    plt.close()
+    fig.savefig(output_path, dpi=dpi)
+    print(f"Generated: {output_path}", flush=True)
 
 
-def plot_scaling(data: List[Dict], output_dir: Path):
+def plot_scaling(data: np.ndarray, output_dir: Path, dpi: int = DEFAULT_DPI):
     """Plot multi-threaded scaling (throughput and latency vs threads)"""
-    if not data:
+    if not data.size:
         print("No scaling data found", file=sys.stderr)
         return
     
-    threads = [int(row['threads']) for row in data]
-    throughput = [float(row['throughput_ops_sec']) for row in data]
-    p99 = [float(row['p99_ns']) for row in data]
+    threads = data['threads']
+    throughput = data['throughput_ops_sec']
+    p99 = data['p99_ns']
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    fig = _figure((14, 5))
+    ax1, ax2 = fig.subplots(1, 2)
     
     # Left plot: Throughput scaling
     ax1.plot(threads, throughput, linewidth=2, color='steelblue', marker='o', markersize=8)
@@ -265,8 +420,8 @@ def plot_scaling(data: List[Dict], output_dir: Path):
     ax1.set_xticks(threads)
     
     # Add ideal linear scaling line
-    if throughput:
-        ideal = [throughput[0] * t / threads[0] for t in threads]
+    if throughput.size:
+        ideal = throughput[0] * threads / threads[0]
         ax1.plot(threads, ideal, linestyle='--', color='gray', alpha=0.5, label='Ideal Linear')
         ax1.legend()
     
@@ -280,28 +435,22 @@ def plot_scaling(data: List[Dict], output_dir: Path):
     ax2.axhline(y=10000, color='red', linestyle='--', linewidth=1, alpha=0.5, label='10µs threshold')
     ax2.legend()
     
-    plt.tight_layout()
+    fig.subplots_adjust(left=0.06, right=0.99, top=0.92, bottom=0.12, wspace=0.18)
     output_path = output_dir / 'scaling.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    print(f"Generated: {output_path}")
-    plt.close()
+    fig.savefig(output_path, dpi=dpi)
+    print(f"Generated: {output_path}", flush=True)
 
 
-def plot_summary_card(latency_data: List[Dict], frag_data: List[Dict], output_dir: Path):
+def plot_summary_card(alloc: Optional[Percentiles], frag_data: np.ndarray, output_dir: Path, dpi: int = DEFAULT_DPI):
     """Generate summary card with key metrics"""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = _figure((10, 6))
+    ax = fig.subplots()
     ax.axis('off')
     
     # Extract metrics
-    alloc_row = next((r for r in latency_data if r.get('op') == 'alloc'), {})
-    p50 = float(alloc_row.get('p50_ns', 0))
-    p99 = float(alloc_row.get('p99_ns', 0))
-    p999 = float(alloc_row.get('p999_ns', 0))
+    p50, p99, p999 = (alloc.p50, alloc.p99, alloc.p999) if alloc else (0.0, 0.0, 0.0)
     
-    avg_efficiency = 0
-    if frag_data:
-        efficiencies = [float(row['efficiency_pct']) for row in frag_data if 'efficiency_pct' in row]
-        avg_efficiency = np.mean(efficiencies) if efficiencies else 0
+    avg_efficiency = float(frag_data['efficiency_pct'].mean()) if frag_data.size else 0.0
     
     # Create text summary
     summary_text = f"""
@@ -338,11 +487,122 @@ Target Workloads:
             fontfamily='monospace',
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
     
-    plt.tight_layout()
+    fig.subplots_adjust(left=0.015, right=0.985, top=0.975, bottom=0.09)
     output_path = output_dir / 'summary.png'
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    print(f"Generated: {output_path}")
-    plt.close()
+    fig.savefig(output_path, dpi=dpi)
+    print(f"Generated: {output_path}", flush=True)
+
+
+def run_plots(tasks: List[Tuple], jobs: int):
+    """Run (plot_func, *args) tasks, in worker processes when jobs > 1
+    
+    Each chart is an independent figure and output file; processes (not
+    threads) are used because pyplot's figure state is per-process.
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        for func, *func_args in tasks:
+            func(*func_args)
+        return
+    
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        futures = [executor.submit(func, *func_args) for func, *func_args in tasks]
+        for future in futures:
+            future.result()  # Re-raise any plotting error
+
+
+def load_results(csv_files: List[Path], loader) -> Dict[str, np.ndarray]:
+    """Load every CSV with loader and merge its sections per schema"""
+    buckets: Dict[str, List[np.ndarray]] = {schema: [] for schema in SCHEMAS}
+    for csv_file in csv_files:
+        print(f"Loading {csv_file.name}...")
+        for schema, section in loader(csv_file):
+            buckets[schema].append(section)
+    
+    data = {schema: merge_sections(sections) for schema, sections in buckets.items()}
+    print(f"Loaded {len(data['latency'])} latency rows, {len(data['raw_latency'])} raw latency samples, "
+          f"{len(data['fragmentation'])} fragmentation rows, {len(data['rss'])} RSS samples, "
+          f"{len(data['scaling'])} scaling points")
+    return data
+
+
+def build_tasks(data: Dict[str, np.ndarray], output_dir: Path, dpi: int) -> List[Tuple]:
+    """Plot tasks (plot_func, *args) for every chart the loaded data supports"""
+    latency_data = data['latency']
+    raw_latency_data = data['raw_latency']
+    frag_data = data['fragmentation']
+    
+    # Shared by the latency charts and the summary card
+    alloc_pct = op_percentiles(latency_data, 'alloc')
+    free_pct = op_percentiles(latency_data, 'free')
+    
+    tasks = []
+    if latency_data.size:
+        tasks.append((plot_latency_comparison, alloc_pct, free_pct, output_dir, dpi))
+    
+    if latency_data.size or raw_latency_data.size:
+        tasks.append((plot_latency_cdf, alloc_pct, output_dir, dpi, raw_latency_data))
+    
+    if frag_data.size:
+        tasks.append((plot_fragmentation, frag_data, output_dir, dpi))
+    
+    if data['rss'].size:
+        tasks.append((plot_rss_over_time, data['rss'], output_dir, dpi))
+    
+    if data['scaling'].size:
+        tasks.append((plot_scaling, data['scaling'], output_dir, dpi))
+    
+    if latency_data.size or frag_data.size:
+        tasks.append((plot_summary_card, alloc_pct, frag_data, output_dir, dpi))
+    
+    return tasks
+
+
+def _task_digest(task: Tuple) -> bytes:
+    """Digest of a plot task's arguments, used to skip re-rendering unchanged charts"""
+    return hashlib.blake2b(pickle.dumps(task[1:], protocol=pickle.HIGHEST_PROTOCOL)).digest()
+
+
+def watch(input_dir: Path, output_dir: Path, loader, dpi: int):
+    """Re-render charts whenever CSVs in input_dir change, until interrupted
+    
+    Rendering stays in this process (serially, reusing the shared Figure), so
+    matplotlib is imported once; charts whose inputs are unchanged are not
+    redrawn and their PNGs are left as they are.
+    """
+    print(f"Watching {input_dir} for CSV changes (Ctrl-C to stop)...")
+    seen = None
+    rendered: Dict[str, bytes] = {}
+    try:
+        while True:
+            snapshot = {}
+            for csv_file in input_dir.glob('*.csv'):
+                try:
+                    stat = csv_file.stat()
+                except FileNotFoundError:
+                    continue  # Removed between glob and stat
+                snapshot[csv_file] = (stat.st_mtime_ns, stat.st_size)
+            
+            if snapshot != seen:
+                seen = snapshot
+                try:
+                    data = load_results(sorted(snapshot), loader)
+                except (ValueError, IndexError, OSError) as e:
+                    # Typically a CSV caught mid-write, or removed/renamed after
+                    # the snapshot; retry once the directory changes again
+                    print(f"Skipping update, could not load input: {e}", file=sys.stderr)
+                else:
+                    changed = []
+                    for task in build_tasks(data, output_dir, dpi):
+                        digest = _task_digest(task)
+                        if rendered.get(task[0].__name__) != digest:
+                            rendered[task[0].__name__] = digest
+                            changed.append(task)
+                    run_plots(changed, jobs=1)
+                    print(f"Updated {len(changed)} chart(s)", flush=True)
+            
+            time.sleep(WATCH_INTERVAL)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
 
 
 def main():
@@ -351,11 +611,24 @@ def main():
                         help='Input directory with CSV files')
     parser.add_argument('--output', type=Path, default=Path('docs/images'),
                         help='Output directory for PNG charts')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always reparse CSV files (ignore and do not write .pkl caches)')
+    parser.add_argument('--dpi', type=int, default=DEFAULT_DPI,
+                        help=f'PNG resolution (default: {DEFAULT_DPI})')
+    parser.add_argument('--jobs', type=int, default=min(4, os.cpu_count() or 1),
+                        help='Worker processes for chart rendering (1 = serial)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and re-render charts whose CSV inputs change')
     args = parser.parse_args()
     
     # Ensure output directory exists
     args.output.mkdir(parents=True, exist_ok=True)
     
+    loader = load_csv if args.no_cache else load_csv_cached
+    if args.watch:
+        watch(args.input, args.output, loader, args.dpi)
+        return
+    
     # Find CSV files
     csv_files = list(args.input.glob('*.csv'))
     if not csv_files:
@@ -365,42 +638,15 @@ def main():
     
     print(f"Found {len(csv_files)} CSV file(s) in {args.input}")
     
-    # Load all data
-    all_data = []
-    for csv_file in csv_files:
-        print(f"Loading {csv_file.name}...")
-        all_data.extend(load_csv(csv_file))
-    
-    if not all_data:
+    # Load all data; sections arrive already classified by their header
+    data = load_results(csv_files, loader)
+    if not any(section.size for section in data.values()):
         print("No data loaded", file=sys.stderr)
         sys.exit(1)
     
-    # Separate by type
-    latency_data = [row for row in all_data if 'op' in row]
-    frag_data = [row for row in all_data if 'efficiency_pct' in row and 'op' not in row]
-    rss_data = [row for row in all_data if 'cycle' in row and 'rss_mib' in row]
-    scaling_data = [row for row in all_data if 'throughput_ops_sec' in row]
-    
-    print(f"Loaded {len(latency_data)} latency rows, {len(frag_data)} fragmentation rows, {len(rss_data)} RSS samples, {len(scaling_data)} scaling points")
-    
     # Generate charts
     print("\nGenerating visualizations...")
-    
-    if latency_data:
-        plot_latency_comparison(latency_data, args.output)
-        plot_latency_cdf(latency_data, args.output)
-    
-    if frag_data:
-        plot_fragmentation(frag_data, args.output)
-    
-    if rss_data:
-        plot_rss_over_time(rss_data, args.output)
-    
-    if scaling_data:
-        plot_scaling(scaling_data, args.output)
-    
-    if latency_data or frag_data:
-        plot_summary_card(latency_data, frag_data, args.output)
+    run_plots(build_tasks(data, args.output, args.dpi), args.jobs)
     
     print(f"\n✓ All charts generated in {args.output}")
     print(f"\nNext step: Add charts to docs/results.md")